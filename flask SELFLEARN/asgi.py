@@ -0,0 +1,27 @@
+'''
+ASGI entry point (pip install asgiref "uvicorn[standard]").
+
+WSGI is one-request-per-worker-thread; once the views start doing real IO
+(DB calls, outbound HTTP) those threads sit blocked and cores go idle. ASGI
+servers multiplex requests on an event loop instead, and uvicorn's "standard"
+extras swap in C-accelerated pieces:
+
+    httptools -> HTTP parsing via llhttp (the Node.js parser) instead of python
+    uvloop    -> libuv event loop, much faster than asyncio's default
+
+a full port to Quart (the async Flask clone) would make the views async def
+but also means dropping the flask-specific provider/response tuning in app.py,
+so for now we keep the app WSGI inside and adapt it at the edge: asgiref's
+WsgiToAsgi runs each request on the loop's threadpool while uvicorn owns the
+socket + parsing. revisit Quart when the views actually await something.
+
+run with:
+
+    uvicorn asgi:app --http httptools --loop uvloop --workers 4
+'''
+
+from asgiref.wsgi import WsgiToAsgi
+
+from app import app as wsgi_app
+
+app = WsgiToAsgi(wsgi_app)
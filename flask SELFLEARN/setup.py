@@ -0,0 +1,32 @@
+'''
+optional ahead-of-time compilation of the views with Cython.
+
+the hot path per request is a chain of tiny python callables
+(request.get_json -> dict.get -> jsonify); Cython compiles them to C so the
+interpreter's bytecode dispatch disappears. the whole app lives in one module
+(app.py), so we cythonize that module directly instead of splitting the views
+into a separate .pyx -- Cython accepts plain .py files as input.
+
+build (needs a C toolchain + pip install cython):
+
+    python setup.py build_ext --inplace
+
+this drops an app.*.so next to app.py; python prefers the extension module
+over the .py when importing, so wsgi.py / gunicorn pick up the compiled
+version automatically. no Cython installed -> setup still works and the app
+just runs interpreted, nothing else changes.
+'''
+
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(["app.py"], language_level=3)
+except ImportError:
+    # no compiler rung available -- fall back to the interpreted module
+    ext_modules = []
+
+setup(
+    name="flask-selflearn",
+    ext_modules=ext_modules,
+)
@@ -0,0 +1,24 @@
+'''
+production entry point.
+
+app.run() uses werkzeug's built-in dev server: single process, python-level
+HTTP parsing, and a known perf regression on werkzeug 2.3+ (hundreds of rps
+down to ~50). a real WSGI server runs multiple worker processes with
+C-accelerated HTTP parsing, which is an order of magnitude more throughput
+for the same app code.
+
+run with gunicorn (pip install gunicorn gevent):
+
+    gunicorn -w 4 -k gevent -b 0.0.0.0:5000 wsgi:app
+
+-w 4      -> 4 worker processes (parallel requests)
+-k gevent -> greenlet workers, many concurrent requests per process
+(plain -k sync also works while the views are CPU-only. meinheld used to be
+the C-parsing worker of choice, but it pins greenlet 0.4.x whose extension
+no longer builds on modern CPython, so it can't go in requirements.txt.)
+
+gunicorn just needs a module exposing the WSGI callable, which is exactly
+what the flask app object is -- so this file only has to import it.
+'''
+
+from app import app  # noqa: F401  (gunicorn looks up wsgi:app)